@@ -152,13 +152,25 @@ const authFetch = async (endpoint, options = {}, isRetry = false) => {
 const fetchData = async (endpoint) => {
     try {
         // authFetch now handles the token refresh automatically
-        const response = await authFetch(`${API_BASE_URL}/${endpoint}/`); 
-        if (!response.ok) {
-            const errorText = await response.text();
-            throw new Error(`HTTP error! status: ${response.status} - ${errorText.substring(0, 100)}...`);
+        // Paginated endpoints return { next, previous, results }; follow `next` until exhausted
+        const data = [];
+        let url = `${API_BASE_URL}/${endpoint}/`;
+        while (url) {
+            const response = await authFetch(url);
+            if (!response.ok) {
+                const errorText = await response.text();
+                throw new Error(`HTTP error! status: ${response.status} - ${errorText.substring(0, 100)}...`);
+            }
+            const page = await response.json();
+            if (Array.isArray(page)) {
+                data.push(...page);
+                url = null;
+            } else {
+                data.push(...page.results);
+                url = page.next;
+            }
         }
-        const data = await response.json();
-        
+
         return data.map(item => ({
             ...item,
             // Convert Django's ISO date string to a Firebase-compatible object structure
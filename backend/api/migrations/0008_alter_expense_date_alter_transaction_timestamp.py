@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-14 19:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_remove_startingcapital_expense_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='expense',
+            name='date',
+            field=models.DateField(db_index=True, default=django.utils.timezone.now, verbose_name='Expense Date'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Timestamp'),
+        ),
+    ]
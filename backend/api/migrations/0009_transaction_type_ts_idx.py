@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-14 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_alter_expense_date_alter_transaction_timestamp'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['transaction_type', '-timestamp'], name='transaction_type_ts_idx'),
+        ),
+    ]
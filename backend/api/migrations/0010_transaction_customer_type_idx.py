@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-14 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_transaction_type_ts_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['customer', 'transaction_type'], name='transaction_customer_type_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-14 19:22
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_transaction_customer_type_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='customer_name_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='material',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='material_name_ci_idx'),
+        ),
+    ]
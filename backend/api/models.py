@@ -1,7 +1,11 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 from django.utils import timezone
 from decimal import Decimal
+
+# Shared zero amount so defaults don't re-parse Decimal('0.00')
+ZERO = Decimal('0.00')
 				 
 
 # Create your models here.
@@ -20,6 +24,12 @@ class Material(models.Model):
     name = models.CharField(max_length=100, unique=True, verbose_name="Material Name")
     color = models.CharField(max_length=50, blank=True, null=True, verbose_name="Color/Description")
 
+    class Meta:
+        indexes = [
+            # Serves case-insensitive lookups (name__iexact)
+            models.Index(Upper('name'), name='material_name_ci_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -27,6 +37,12 @@ class Customer(models.Model):
     """Stores information about the purchasing parties."""
     name = models.CharField(max_length=100, unique=True, verbose_name="Customer Name")
 
+    class Meta:
+        indexes = [
+            # Serves case-insensitive lookups (name__iexact)
+            models.Index(Upper('name'), name='customer_name_ci_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -34,7 +50,7 @@ class Expense(models.Model):
     description = models.CharField(max_length=255, verbose_name="Expense Description")
     amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Amount")
     # Date incurred (not auto_now_add, allows backdating)
-    date = models.DateField(default=timezone.now, verbose_name="Expense Date")
+    date = models.DateField(default=timezone.now, db_index=True, verbose_name="Expense Date")
     expense_type = models.CharField(max_length=10)
 
     def __str__(self):
@@ -56,11 +72,23 @@ class Transaction(models.Model):
     # Financial Data
     quantity = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, verbose_name="Quantity")
     total_price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Total Value")
-    money_received = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, default=Decimal('0.00'), verbose_name="Amount Received")
+    money_received = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, default=ZERO, verbose_name="Amount Received")
 
     # Metadata
     description = models.CharField(max_length=255, blank=True, null=True, verbose_name="Notes")
-    timestamp = models.DateTimeField(auto_now_add=True, verbose_name="Timestamp")
+    timestamp = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="Timestamp")
+
+    class Meta:
+        indexes = [
+            # Filter by type, newest first
+            models.Index(fields=['transaction_type', '-timestamp'], name='transaction_type_ts_idx'),
+            # Per-customer balance aggregation
+            models.Index(fields=['customer', 'transaction_type'], name='transaction_customer_type_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.get_transaction_type_display()} on {self.timestamp.strftime('%Y-%m-%d')}"
+        return f"{_TX_TYPE_DISPLAY.get(self.transaction_type, self.transaction_type)} on {self.timestamp:%Y-%m-%d}"
+
+
+# Label lookup for Transaction.__str__, built once instead of per call
+_TX_TYPE_DISPLAY = dict(Transaction.TRANSACTION_CHOICES)
@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TransactionCursorPagination(CursorPagination):
+    """Keyset pagination over the newest Transactions first."""
+    ordering = '-timestamp'
+    page_size = 50
+
+
+class ExpenseCursorPagination(CursorPagination):
+    """Keyset pagination over the most recent Expenses first."""
+    # Expense dates repeat, so break ties on id to keep pages stable.
+    ordering = ('-date', '-id')
+    page_size = 50
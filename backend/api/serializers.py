@@ -1,7 +1,11 @@
+import logging
+
 from django.contrib.auth.models import User
 from rest_framework import serializers
 from .models import StartingCapital, Material, Customer, Expense, Transaction
 
+logger = logging.getLogger(__name__)
+
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -11,8 +15,8 @@ class UserSerializer(serializers.ModelSerializer):
         extra_kwargs = {"password": {"write_only": True}}
 
     def create(self, validated_data):
-        print(validated_data)
         user = User.objects.create_user(**validated_data)
+        logger.debug("user create id=%s", user.id)
         return user
 
 class LoginSerializer(serializers.Serializer):
@@ -22,65 +26,101 @@ class LoginSerializer(serializers.Serializer):
 class StartingCapitalSerializer(serializers.ModelSerializer):
     class Meta:
         model = StartingCapital
-        fields = '__all__'
+        fields = ('id', 'description', 'amount', 'date')
+
+class StartingCapitalReadSerializer(StartingCapitalSerializer):
+    class Meta(StartingCapitalSerializer.Meta):
+        read_only_fields = StartingCapitalSerializer.Meta.fields
 
 class MaterialSerializer(serializers.ModelSerializer):
     class Meta:
         model = Material
-        fields = '__all__'
+        fields = ('id', 'name', 'color')
+
+class MaterialReadSerializer(MaterialSerializer):
+    class Meta(MaterialSerializer.Meta):
+        read_only_fields = MaterialSerializer.Meta.fields
 
 class CustomerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Customer
-        fields = '__all__'
+        fields = ('id', 'name')
+
+class CustomerReadSerializer(CustomerSerializer):
+    class Meta(CustomerSerializer.Meta):
+        read_only_fields = CustomerSerializer.Meta.fields
 
 class ExpenseSerializer(serializers.ModelSerializer):
     # Ensure date is outputted correctly
     date = serializers.DateField(format="%Y-%m-%d")
     class Meta:
         model = Expense
-        fields = '__all__'
+        fields = ('id', 'description', 'amount', 'date', 'expense_type')
+
+class ExpenseReadSerializer(ExpenseSerializer):
+    date = serializers.DateField(format="%Y-%m-%d", read_only=True)
+    class Meta(ExpenseSerializer.Meta):
+        read_only_fields = ExpenseSerializer.Meta.fields
+
+
+def _is_not_none(value):
+    return value is not None
 
 
 class TransactionSerializer(serializers.ModelSerializer):
     # Read-only fields to display names instead of IDs on GET requests
-    material_name = serializers.CharField(source='material.name', read_only=True)
-    customer_name = serializers.CharField(source='customer.name', read_only=True)
+    material_name = serializers.CharField(source='material.name', read_only=True, default=None)
+    customer_name = serializers.CharField(source='customer.name', read_only=True, default=None)
     
     class Meta:
         model = Transaction
-        fields = '__all__'
+        fields = (
+            'id', 'material_name', 'customer_name', 'transaction_type', 'quantity',
+            'total_price', 'money_received', 'description', 'timestamp', 'material', 'customer',
+        )
         read_only_fields = ('timestamp',) # Automatically set by model
 
+    # (field, presence check, error) each transaction type must carry, in order
+    # The client sends the RC paid amount in total_price.
+    _REQUIRED = {
+        'CR': (
+            ('material', bool, "Material is required for a Purchase (CR)."),
+            ('quantity', bool, "Quantity is required for a Purchase (CR)."),
+        ),
+        'DB': (
+            ('material', bool, "Material is required for a Sale (DB)."),
+            ('customer', bool, "Customer is required for a Sale (DB)."),
+            ('quantity', bool, "Quantity is required for a Sale (DB)."),
+        ),
+        'RC': (
+            ('customer', bool, "Customer is required for a Reconciliation (RC)."),
+            # A zero payment is still a payment; only a missing amount is rejected
+            ('total_price', _is_not_none, "Amount received is required for Reconciliation (RC)."),
+        ),
+    }
+
     # Custom validation to enforce required fields based on transaction type
     def validate(self, data):
-        tx_type = data.get('transaction_type')
-        
-        # Validation for Credit (CR) / Purchase
-        if tx_type == 'CR':
-            if not data.get('material'):
-                raise serializers.ValidationError({"material": "Material is required for a Purchase (CR)."})
-            if not data.get('quantity'):
-                raise serializers.ValidationError({"quantity": "Quantity is required for a Purchase (CR)."})
-        
-        # Validation for Debit (DB) / Sale
-        elif tx_type == 'DB':
-            if not data.get('material'):
-                raise serializers.ValidationError({"material": "Material is required for a Sale (DB)."})
-            if not data.get('customer'):
-                raise serializers.ValidationError({"customer": "Customer is required for a Sale (DB)."})
-            if not data.get('quantity'):
-                raise serializers.ValidationError({"quantity": "Quantity is required for a Sale (DB)."})
-
-        # Validation for Reconciliation (RC) / Customer Payment
-        elif tx_type == 'RC':
-            if not data.get('customer'):
-                raise serializers.ValidationError({"customer": "Customer is required for a Reconciliation (RC)."})
-            # The client-side will send the amount in 'total_price' or 'money_received' 
-            # based on how we structure the form. For RC, we expect the received amount
-            # to be present in 'total_price' or mapped to 'amount' if a separate model was used.
-            # Sticking to the spec's Transaction model: use total_price for the paid amount.
-            if 'total_price' not in data or data.get('total_price') is None:
-                 raise serializers.ValidationError({"total_price": "Amount received is required for Reconciliation (RC)."})
-            
+        for field, is_present, message in self._REQUIRED.get(data.get('transaction_type'), ()):
+            if not is_present(data.get(field)):
+                raise serializers.ValidationError({field: message})
         return data
+
+
+class CustomerBalanceSerializer(serializers.Serializer):
+    """Output shape for the pre-aggregated TransactionViewSet.balances rows."""
+    customer = serializers.IntegerField(read_only=True)
+    revenue = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    received = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    owed = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+
+
+class TransactionReadSerializer(serializers.ModelSerializer):
+    # Output-only twin of TransactionSerializer, without the write validation
+    material_name = serializers.CharField(source='material.name', read_only=True, default=None)
+    customer_name = serializers.CharField(source='customer.name', read_only=True, default=None)
+
+    class Meta:
+        model = Transaction
+        fields = TransactionSerializer.Meta.fields
+        read_only_fields = fields
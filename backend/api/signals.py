@@ -0,0 +1,18 @@
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Customer, Material
+
+
+def list_cache_version_key(model):
+    return f'{model._meta.label_lower}.list_version'
+
+
+@receiver([post_save, post_delete], sender=Material)
+@receiver([post_save, post_delete], sender=Customer)
+def bump_list_cache_version(sender, **kwargs):
+    """Any write through the ORM (API, admin, shell) retires cached lists."""
+    cache.set(list_cache_version_key(sender), time.time_ns(), None)
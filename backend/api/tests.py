@@ -1,3 +1,193 @@
-from django.test import TestCase
+import csv
+import datetime
+import json
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Customer, Expense, Material, Transaction
+from .views import CustomerViewSet
+
+
+class LedgerTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.material = Material.objects.create(name='Iron')
+        self.customer = Customer.objects.create(name='Acme')
+
+    def sale(self, total_price='10.00', money_received='0.00', customer=None):
+        return Transaction.objects.create(
+            transaction_type='DB', material=self.material, customer=customer or self.customer,
+            quantity=Decimal('1.00'), total_price=Decimal(total_price), money_received=Decimal(money_received),
+        )
+
+
+class TransactionQueryTests(LedgerTestCase):
+    def test_list_query_count_does_not_grow_with_rows(self):
+        # One page query plus one IN lookup each for materials and customers
+        for rows in (5, 40):
+            Transaction.objects.all().delete()
+            for _ in range(rows):
+                self.sale()
+            with self.assertNumQueries(3):
+                response = self.client.get('/api/transactions/')
+            self.assertEqual(len(response.data['results']), rows)
+            self.assertEqual(response.data['results'][0]['material_name'], 'Iron')
+            self.assertEqual(response.data['results'][0]['customer_name'], 'Acme')
+
+    def test_retrieve_is_a_single_joined_query(self):
+        tx = self.sale()
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/transactions/{tx.pk}/')
+        self.assertEqual(response.data['material_name'], 'Iron')
+        self.assertEqual(response.data['customer_name'], 'Acme')
+
+
+class PaginationTests(LedgerTestCase):
+    def collect(self, url):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(set(response.data), {'next', 'previous', 'results'})
+            pages.append(response.data['results'])
+            url = response.data['next']
+        return pages
+
+    def test_transactions_are_paged_newest_first(self):
+        created = [self.sale().pk for _ in range(60)]
+        pages = self.collect('/api/transactions/')
+        self.assertEqual([len(page) for page in pages], [50, 10])
+        self.assertEqual([row['id'] for page in pages for row in page], created[::-1])
+
+    def test_expenses_with_the_same_date_break_ties_on_id(self):
+        day = datetime.date(2025, 1, 1)
+        created = [
+            Expense.objects.create(description=f'e{i}', amount=Decimal('1.00'), date=day, expense_type='op').pk
+            for i in range(60)
+        ]
+        pages = self.collect('/api/expenses/')
+        self.assertEqual([len(page) for page in pages], [50, 10])
+        self.assertEqual([row['id'] for page in pages for row in page], sorted(created, reverse=True))
+
+
+class TransactionValidationTests(LedgerTestCase):
+    def post(self, **body):
+        return self.client.post('/api/transactions/', body, format='json')
+
+    def test_required_fields_per_type(self):
+        cases = [
+            ({'transaction_type': 'CR', 'quantity': '1', 'total_price': '1'},
+             'material', "Material is required for a Purchase (CR)."),
+            ({'transaction_type': 'CR', 'material': self.material.pk, 'total_price': '1'},
+             'quantity', "Quantity is required for a Purchase (CR)."),
+            ({'transaction_type': 'DB', 'material': self.material.pk, 'quantity': '1', 'total_price': '1'},
+             'customer', "Customer is required for a Sale (DB)."),
+            ({'transaction_type': 'DB', 'material': self.material.pk, 'customer': self.customer.pk, 'total_price': '1'},
+             'quantity', "Quantity is required for a Sale (DB)."),
+            ({'transaction_type': 'RC', 'total_price': '1'},
+             'customer', "Customer is required for a Reconciliation (RC)."),
+        ]
+        for body, field, message in cases:
+            with self.subTest(body=body):
+                response = self.post(**body)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data, {field: [message]})
+
+    def test_zero_quantity_is_rejected_but_zero_payment_is_not(self):
+        response = self.post(transaction_type='CR', material=self.material.pk, quantity='0', total_price='1')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.post(transaction_type='RC', customer=self.customer.pk, total_price='0')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class BulkCreateTests(LedgerTestCase):
+    def row(self, **overrides):
+        return {'transaction_type': 'CR', 'material': self.material.pk, 'quantity': '2', 'total_price': '3', **overrides}
+
+    def test_creates_every_row(self):
+        response = self.client.post('/api/transactions/bulk/', [self.row() for _ in range(3)], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(Transaction.objects.count(), 3)
+
+    def test_one_invalid_row_creates_nothing(self):
+        rows = [self.row(), self.row(transaction_type='DB')]
+        response = self.client.post('/api/transactions/bulk/', rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[1], {'customer': ["Customer is required for a Sale (DB)."]})
+        self.assertEqual(Transaction.objects.count(), 0)
+
+
+class BalanceTests(LedgerTestCase):
+    def test_owed_is_sales_less_money_received_and_payments(self):
+        other = Customer.objects.create(name='Other')
+        self.sale(total_price='100.00', money_received='30.00')
+        self.sale(total_price='50.00')
+        Transaction.objects.create(transaction_type='RC', customer=self.customer, total_price=Decimal('20.00'))
+        self.sale(total_price='5.00', customer=other)
+        Transaction.objects.create(transaction_type='CR', material=self.material, quantity=1, total_price=Decimal('99.00'))
+
+        response = self.client.get('/api/transactions/balances/')
+        self.assertEqual(response.data, [
+            {'customer': self.customer.pk, 'revenue': '150.00', 'received': '50.00', 'owed': '100.00'},
+            {'customer': other.pk, 'revenue': '5.00', 'received': '0.00', 'owed': '5.00'},
+        ])
+
+
+class CachedListTests(LedgerTestCase):
+    def test_repeat_get_with_etag_is_not_modified(self):
+        response = self.client.get('/api/materials/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertNotIn('max-age', response['Cache-Control'])
+
+        response = self.client.get('/api/materials/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_api_write_changes_the_list(self):
+        etag = self.client.get('/api/materials/')['ETag']
+        self.client.post('/api/materials/', {'name': 'Gold'}, format='json')
+
+        response = self.client.get('/api/materials/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['name'] for row in response.data], ['Gold', 'Iron'])
+
+    def test_orm_save_outside_the_api_changes_the_list(self):
+        etag = self.client.get('/api/customers/')['ETag']
+        self.customer.name = 'Acme Ltd'
+        self.customer.save()
+
+        response = self.client.get('/api/customers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['name'], 'Acme Ltd')
+
+
+class ExportTests(LedgerTestCase):
+    def test_streams_csv_for_text_csv_clients(self):
+        self.sale(total_price='10.00', money_received='4.00')
+        response = self.client.get('/api/transactions/export/', HTTP_ACCEPT='text/csv')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+
+        rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0], ['timestamp', 'transaction_type', 'material', 'customer', 'quantity', 'total_price', 'money_received'])
+        self.assertEqual(rows[1][1:], ['DB', 'Iron', 'Acme', '1.00', '10.00', '4.00'])
+
+
+class StreamingListTests(LedgerTestCase):
+    def test_lists_above_the_threshold_are_streamed(self):
+        Customer.objects.bulk_create([Customer(name=f'c{i:03}') for i in range(25)])
+        with mock.patch.object(CustomerViewSet, 'stream_threshold', 10), \
+                mock.patch.object(CustomerViewSet, 'stream_chunk_size', 10):
+            response = self.client.get('/api/customers/')
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(data), 26)
+        self.assertEqual(data[0]['name'], 'Acme')
+        self.assertEqual(data[-1]['name'], 'c024')
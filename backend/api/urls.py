@@ -4,7 +4,7 @@ from rest_framework import routers
 from .views import StartingCapitalViewSet, MaterialViewSet, CustomerViewSet, ExpenseViewSet, TransactionViewSet
 
 # Initialize the DRF Router
-router = routers.DefaultRouter()
+router = routers.SimpleRouter()
 
 # Register ViewSets with their respective path prefixes
 router.register(r'startingcapital', StartingCapitalViewSet)
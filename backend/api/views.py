@@ -1,11 +1,29 @@
 from rest_framework import viewsets
-from .models import StartingCapital, Material, Customer, Expense, Transaction
+from .models import StartingCapital, Material, Customer, Expense, Transaction, ZERO
 from .serializers import StartingCapitalSerializer, MaterialSerializer, CustomerSerializer, ExpenseSerializer, TransactionSerializer, UserSerializer, LoginSerializer
+from .serializers import StartingCapitalReadSerializer, MaterialReadSerializer, CustomerReadSerializer, ExpenseReadSerializer, TransactionReadSerializer
+from .serializers import CustomerBalanceSerializer
+from .pagination import TransactionCursorPagination, ExpenseCursorPagination
+from .renderers import CSVRenderer, ORJSONRenderer
+from .signals import list_cache_version_key
 from django.contrib.auth.models import User
-from rest_framework import generics
+from rest_framework import generics, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.contrib.auth import authenticate
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Max, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+import csv
+import hashlib
+import itertools
+import time
 # Create your views here.
 
 class CreateUserView(generics.CreateAPIView):
@@ -19,43 +37,222 @@ class LoginView(generics.GenericAPIView):
 	def post(self, request, *args, **kwargs):
 		username = request.data.get("username")
 		password = request.data.get("password")
-		user = authenticate(usernane = username, password = password)
+		user = authenticate(username = username, password = password)
 		if user is not None:
 			refresh = RefreshToken.for_user(user)
-			user_serializer = UserSerializer(user)
 			return Response({
 				'refresh': str(refresh),
 				'access':str(refresh.access_token),
-				'user': user_serializer.data
+				# Same shape as UserSerializer(user).data, without the serializer
+				'user': {'id': user.id, 'username': user.username}
 			})
 		else:
 			return Response({'detail': 'Invalid credentials'}, status=401)
 
 
-class StartingCapitalViewSet(viewsets.ModelViewSet):
+class _Echo:
+    """File-like object whose write() hands the line back for streaming."""
+    def write(self, value):
+        return value
+
+
+class ReadSerializerMixin:
+    """Serve list/retrieve with a read-only serializer, writes with serializer_class."""
+    read_serializer_class = None
+
+    def get_serializer_class(self):
+        if self.action in ('list', 'retrieve') and self.read_serializer_class is not None:
+            return self.read_serializer_class
+        return super().get_serializer_class()
+
+
+class CachedListMixin:
+    """
+    Cache the serialized list server-side and tag it with an ETag derived
+    from the data. Saves and deletes on the model bump the version (see
+    signals.py), and the cache key also carries the table's row count and
+    max id, so inserts/deletes the version never saw (another worker with a
+    per-process cache) still miss. Clients are told to revalidate every
+    time rather than reuse their own copy.
+    """
+    list_cache_timeout = 60 * 5
+
+    def list(self, request, *args, **kwargs):
+        # Seed a fresh version after a cache flush/restart so ETags handed out
+        # earlier can't match.
+        version = cache.get_or_set(list_cache_version_key(self.queryset.model), time.time_ns, None)
+        state = self.filter_queryset(self.get_queryset()).aggregate(max_id=Max('pk'), count=Count('pk'))
+        key = f'{self.basename}.list:{version}:{state["max_id"]}:{state["count"]}:{request.get_full_path()}'
+
+        entry = cache.get(key)
+        if entry is None:
+            response = super().list(request, *args, **kwargs)
+            # Streamed lists (see StreamingListMixin) are too big to cache
+            if not isinstance(response, Response):
+                patch_cache_control(response, private=True, no_cache=True)
+                return response
+            entry = (response.data, hashlib.md5(ORJSONRenderer().render(response.data)).hexdigest())
+            cache.set(key, entry, self.list_cache_timeout)
+        else:
+            response = Response(entry[0])
+
+        # Hash of the data itself; Accept is mixed in as it picks the representation
+        list_etag = quote_etag(hashlib.md5(f'{entry[1]}:{request.META.get("HTTP_ACCEPT", "")}'.encode()).hexdigest())
+        response = get_conditional_response(request, etag=list_etag, response=response)
+        response.headers['ETag'] = list_etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class StreamingListMixin:
+    """
+    Once an unpaginated list outgrows stream_threshold rows, stream it as a
+    JSON array built from server-side cursor chunks instead of materializing
+    every row first.
+    """
+    stream_threshold = 5000
+    stream_chunk_size = 1000
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator is not None or queryset.count() <= self.stream_threshold:
+            return super().list(request, *args, **kwargs)
+
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        renderer = ORJSONRenderer()
+
+        def stream():
+            rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+            yield b'['
+            separator = b''
+            while chunk := list(itertools.islice(rows, self.stream_chunk_size)):
+                data = serializer_class(chunk, many=True, context=context).data
+                # Drop the chunk's own brackets and splice it into the array
+                yield separator + renderer.render(data)[1:-1]
+                separator = b','
+            yield b']'
+
+        return StreamingHttpResponse(stream(), content_type=renderer.media_type)
+
+
+class StartingCapitalViewSet(ReadSerializerMixin, viewsets.ModelViewSet):
     """API endpoint for Materials."""
     queryset = StartingCapital.objects.all()
     serializer_class = StartingCapitalSerializer
+    read_serializer_class = StartingCapitalReadSerializer
 
 
-class MaterialViewSet(viewsets.ModelViewSet):
+class MaterialViewSet(CachedListMixin, StreamingListMixin, ReadSerializerMixin, viewsets.ModelViewSet):
     """API endpoint for Materials."""
     queryset = Material.objects.all().order_by('name')
     serializer_class = MaterialSerializer
+    read_serializer_class = MaterialReadSerializer
 
-class CustomerViewSet(viewsets.ModelViewSet):
+class CustomerViewSet(CachedListMixin, StreamingListMixin, ReadSerializerMixin, viewsets.ModelViewSet):
     """API endpoint for Customers."""
     queryset = Customer.objects.all().order_by('name')
     serializer_class = CustomerSerializer
+    read_serializer_class = CustomerReadSerializer
 
 
-class ExpenseViewSet(viewsets.ModelViewSet):
+class ExpenseViewSet(ReadSerializerMixin, viewsets.ModelViewSet):
     """API endpoint for Expenses."""
     queryset = Expense.objects.all().order_by('-date')
     serializer_class = ExpenseSerializer
+    read_serializer_class = ExpenseReadSerializer
+    pagination_class = ExpenseCursorPagination
 
 
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(ReadSerializerMixin, viewsets.ModelViewSet):
     """API endpoint for Transactions (CR, DB, RC)."""
     queryset = Transaction.objects.all().order_by('-timestamp')
     serializer_class = TransactionSerializer
+    read_serializer_class = TransactionReadSerializer
+    pagination_class = TransactionCursorPagination
+
+    # Every Transaction column; retrieve lists them so .only() can trim the
+    # joined material/customer down to their names
+    read_fields = (
+        'id', 'transaction_type', 'material_id', 'customer_id', 'quantity',
+        'total_price', 'money_received', 'timestamp', 'description',
+    )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Load material/customer up front so material_name/customer_name
+        # don't cost two extra queries per row on reads.
+        if self.action == 'list':
+            # Pages reuse a handful of materials/customers, so two small IN
+            # lookups beat widening every joined row.
+            queryset = queryset.prefetch_related(
+                Prefetch('material', queryset=Material.objects.only('id', 'name')),
+                Prefetch('customer', queryset=Customer.objects.only('id', 'name')),
+            )
+        elif self.action == 'retrieve':
+            queryset = queryset.select_related('material', 'customer').only(
+                *self.read_fields, 'material__name', 'customer__name',
+            )
+        return queryset
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Create a JSON array of Transactions with batched INSERTs."""
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            created = Transaction.objects.bulk_create(
+                [Transaction(**row) for row in serializer.validated_data],
+                batch_size=500,
+            )
+        return Response(self.get_serializer(created, many=True).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False)
+    def balances(self, request):
+        """Per-customer sales, payments and outstanding balance, summed in SQL."""
+        def total(field, tx_type):
+            return Coalesce(
+                Sum(field, filter=Q(transaction_type=tx_type)),
+                Value(ZERO),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            )
+
+        # Money comes in as money_received on a sale (DB) and as total_price
+        # on a payment (RC), matching how the dashboard computes borrowings.
+        rows = (
+            Transaction.objects.filter(customer__isnull=False)
+            .values('customer')
+            .annotate(
+                revenue=total('total_price', 'DB'),
+                received=total('money_received', 'DB') + total('total_price', 'RC'),
+            )
+            .annotate(owed=F('revenue') - F('received'))
+            .order_by('customer')
+        )
+        return Response(CustomerBalanceSerializer(rows, many=True).data)
+
+    @action(detail=False, methods=['get'], renderer_classes=[CSVRenderer])
+    def export(self, request):
+        """Stream the full ledger as CSV straight from value tuples."""
+        header = (
+            'timestamp', 'transaction_type', 'material', 'customer',
+            'quantity', 'total_price', 'money_received',
+        )
+        rows = (
+            Transaction.objects.order_by('timestamp')
+            .values_list(
+                'timestamp', 'transaction_type', 'material__name', 'customer__name',
+                'quantity', 'total_price', 'money_received',
+            )
+            .iterator(chunk_size=2000)
+        )
+        writer = csv.writer(_Echo())
+
+        def stream():
+            yield writer.writerow(header)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="transactions.csv"'
+        return response
@@ -0,0 +1,12 @@
+"""
+Settings for test and load-test runs.
+
+Usage: python manage.py test --settings=backend.test_settings
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Deliberately weak and fast; never use outside tests
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]